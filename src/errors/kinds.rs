@@ -1,3 +1,5 @@
+use std::sync::Arc;
+
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 
@@ -98,7 +100,7 @@ pub enum ErrorKind {
     },
     #[strum(message = "String must match pattern '{pattern}'")]
     StrPatternMismatch {
-        pattern: String,
+        pattern: Arc<str>,
     },
     // ---------------------
     // dict errors
@@ -220,11 +222,11 @@ pub enum ErrorKind {
     // literals
     #[strum(serialize = "literal_error", message = "Value must be {expected}")]
     LiteralSingleError {
-        expected: String,
+        expected: Arc<str>,
     },
     #[strum(serialize = "literal_error", message = "Value must be one of: {expected}")]
     LiteralMultipleError {
-        expected: String,
+        expected: Arc<str>,
     },
     // ---------------------
     // date errors
@@ -402,7 +404,10 @@ impl ErrorKind {
             Self::TooLong { max_length } => py_dict!(py, max_length),
             Self::StrTooShort { min_length } => py_dict!(py, min_length),
             Self::StrTooLong { max_length } => py_dict!(py, max_length),
-            Self::StrPatternMismatch { pattern } => py_dict!(py, pattern),
+            Self::StrPatternMismatch { pattern } => {
+                let pattern: &str = pattern;
+                py_dict!(py, pattern)
+            }
             Self::DictFromMapping { error } => py_dict!(py, error),
             Self::IntNan { nan_value } => py_dict!(py, nan_value),
             Self::IntMultipleOf { multiple_of } => py_dict!(py, multiple_of),
@@ -420,8 +425,14 @@ impl ErrorKind {
             Self::ValueError { error } => py_dict!(py, error),
             Self::AssertionError { error } => py_dict!(py, error),
             Self::CustomError { value_error } => Ok(value_error.context(py)),
-            Self::LiteralSingleError { expected } => py_dict!(py, expected),
-            Self::LiteralMultipleError { expected } => py_dict!(py, expected),
+            Self::LiteralSingleError { expected } => {
+                let expected: &str = expected;
+                py_dict!(py, expected)
+            }
+            Self::LiteralMultipleError { expected } => {
+                let expected: &str = expected;
+                py_dict!(py, expected)
+            }
             Self::DateParsing { error } => py_dict!(py, error),
             Self::DateFromDatetimeParsing { error } => py_dict!(py, error),
             Self::TimeParsing { error } => py_dict!(py, error),
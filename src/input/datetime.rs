@@ -6,6 +6,7 @@ use strum::EnumMessage;
 
 use crate::errors::{ErrorKind, ValError, ValResult};
 
+use super::shared::digit_pairs;
 use super::Input;
 
 pub enum EitherDate<'a> {
@@ -243,6 +244,9 @@ impl<'a> EitherDateTime<'a> {
 }
 
 pub fn bytes_as_date<'a>(input: &'a impl Input<'a>, bytes: &[u8]) -> ValResult<'a, EitherDate<'a>> {
+    if let Some(date) = parse_iso_date_fast(bytes) {
+        return Ok(date.into());
+    }
     match Date::parse_bytes(bytes) {
         Ok(date) => Ok(date.into()),
         Err(err) => Err(ValError::new(
@@ -254,6 +258,36 @@ pub fn bytes_as_date<'a>(input: &'a impl Input<'a>, bytes: &[u8]) -> ValResult<'
     }
 }
 
+/// Fast path for the overwhelmingly common `YYYY-MM-DD` format, all eight digits are checked and combined
+/// at once as lanes of a `u64` (SWAR). Returns `None` for anything it can't handle, including invalid dates,
+/// in which case speedate parses the input and provides the error.
+fn parse_iso_date_fast(bytes: &[u8]) -> Option<Date> {
+    if bytes.len() != 10 || bytes[4] != b'-' || bytes[7] != b'-' {
+        return None;
+    }
+    let pairs = digit_pairs([
+        bytes[0], bytes[1], bytes[2], bytes[3], bytes[5], bytes[6], bytes[8], bytes[9],
+    ])?;
+
+    let year = (pairs & 0xFF) as u16 * 100 + ((pairs >> 16) & 0xFF) as u16;
+    let month = ((pairs >> 32) & 0xFF) as u8;
+    let day = ((pairs >> 48) & 0xFF) as u8;
+
+    let max_day = match month {
+        1 | 3 | 5 | 7 | 8 | 10 | 12 => 31,
+        4 | 6 | 9 | 11 => 30,
+        2 => match year % 4 == 0 && (year % 100 != 0 || year % 400 == 0) {
+            true => 29,
+            false => 28,
+        },
+        _ => return None,
+    };
+    match year > 0 && (1..=max_day).contains(&day) {
+        true => Some(Date { year, month, day }),
+        false => None,
+    }
+}
+
 pub fn bytes_as_time<'a>(input: &'a impl Input<'a>, bytes: &[u8]) -> ValResult<'a, EitherTime<'a>> {
     match Time::parse_bytes(bytes) {
         Ok(date) => Ok(date.into()),
@@ -1,3 +1,4 @@
+use std::borrow::Cow;
 use std::str::from_utf8;
 
 use pyo3::exceptions::PyAttributeError;
@@ -110,8 +111,11 @@ impl<'a> Input<'a> for PyAny {
         if let Ok(py_bytes) = self.cast_as::<PyBytes>() {
             Ok(py_bytes.into())
         } else if let Ok(py_str) = self.cast_as::<PyString>() {
-            let string = py_str.to_string_lossy().to_string();
-            Ok(string.into_bytes().into())
+            // borrow the string's UTF-8 buffer where possible, only strings with surrogates need a copy
+            match py_str.to_string_lossy() {
+                Cow::Borrowed(str) => Ok(str.as_bytes().into()),
+                Cow::Owned(string) => Ok(string.into_bytes().into()),
+            }
         } else if let Ok(py_byte_array) = self.cast_as::<PyByteArray>() {
             Ok(py_byte_array.to_vec().into())
         } else {
@@ -339,7 +343,8 @@ impl<'a> Input<'a> for PyAny {
             Err(ValError::new(ErrorKind::DateType, self))
         } else if let Ok(date) = self.cast_as::<PyDate>() {
             Ok(date.into())
-        } else if let Ok(str) = self.extract::<String>() {
+        } else if let Ok(Ok(str)) = self.cast_as::<PyString>().map(|py_str| py_str.to_str()) {
+            // strings which aren't valid UTF-8 (e.g. with lone surrogates) fall through to the type error
             bytes_as_date(self, str.as_bytes())
         } else if let Ok(py_bytes) = self.cast_as::<PyBytes>() {
             bytes_as_date(self, py_bytes.as_bytes())
@@ -359,7 +364,7 @@ impl<'a> Input<'a> for PyAny {
     fn lax_time(&self) -> ValResult<EitherTime> {
         if let Ok(time) = self.cast_as::<PyTime>() {
             Ok(time.into())
-        } else if let Ok(str) = self.extract::<String>() {
+        } else if let Ok(Ok(str)) = self.cast_as::<PyString>().map(|py_str| py_str.to_str()) {
             bytes_as_time(self, str.as_bytes())
         } else if let Ok(py_bytes) = self.cast_as::<PyBytes>() {
             bytes_as_time(self, py_bytes.as_bytes())
@@ -385,7 +390,7 @@ impl<'a> Input<'a> for PyAny {
     fn lax_datetime(&self) -> ValResult<EitherDateTime> {
         if let Ok(dt) = self.cast_as::<PyDateTime>() {
             Ok(dt.into())
-        } else if let Ok(str) = self.extract::<String>() {
+        } else if let Ok(Ok(str)) = self.cast_as::<PyString>().map(|py_str| py_str.to_str()) {
             bytes_as_datetime(self, str.as_bytes())
         } else if let Ok(py_bytes) = self.cast_as::<PyBytes>() {
             bytes_as_datetime(self, py_bytes.as_bytes())
@@ -172,7 +172,8 @@ pub enum EitherString<'a> {
 impl<'a> EitherString<'a> {
     pub fn as_cow(&self) -> Cow<str> {
         match self {
-            Self::Cow(data) => data.clone(),
+            // borrow rather than clone, which would copy owned strings
+            Self::Cow(data) => Cow::Borrowed(data.as_ref()),
             Self::Py(py_str) => py_str.to_string_lossy(),
         }
     }
@@ -2,27 +2,47 @@ use crate::errors::{ErrorKind, ValError, ValResult};
 
 use super::Input;
 
+/// Pack up to 7 bytes, lowercased, into a `u64` with the length in the top byte, so a string can be
+/// compared case-insensitively against each candidate with a single integer comparison
+const fn bool_key(bytes: &[u8]) -> u64 {
+    let mut key = (bytes.len() as u64) << 56;
+    let mut i = 0;
+    while i < bytes.len() {
+        key |= (bytes[i].to_ascii_lowercase() as u64) << (i * 8);
+        i += 1;
+    }
+    key
+}
+
+const FALSE_KEYS: [u64; 6] = [
+    bool_key(b"0"),
+    bool_key(b"f"),
+    bool_key(b"n"),
+    bool_key(b"no"),
+    bool_key(b"off"),
+    bool_key(b"false"),
+];
+const TRUE_KEYS: [u64; 6] = [
+    bool_key(b"1"),
+    bool_key(b"t"),
+    bool_key(b"y"),
+    bool_key(b"on"),
+    bool_key(b"yes"),
+    bool_key(b"true"),
+];
+
 #[inline]
 pub fn str_as_bool<'a>(input: &'a impl Input<'a>, str: &str) -> ValResult<'a, bool> {
-    if str == "0"
-        || str.eq_ignore_ascii_case("f")
-        || str.eq_ignore_ascii_case("n")
-        || str.eq_ignore_ascii_case("no")
-        || str.eq_ignore_ascii_case("off")
-        || str.eq_ignore_ascii_case("false")
-    {
-        Ok(false)
-    } else if str == "1"
-        || str.eq_ignore_ascii_case("t")
-        || str.eq_ignore_ascii_case("y")
-        || str.eq_ignore_ascii_case("on")
-        || str.eq_ignore_ascii_case("yes")
-        || str.eq_ignore_ascii_case("true")
-    {
-        Ok(true)
-    } else {
-        Err(ValError::new(ErrorKind::BoolParsing, input))
+    // no valid value is longer than "false"
+    if str.len() <= 5 {
+        let key = bool_key(str.as_bytes());
+        if FALSE_KEYS.contains(&key) {
+            return Ok(false);
+        } else if TRUE_KEYS.contains(&key) {
+            return Ok(true);
+        }
     }
+    Err(ValError::new(ErrorKind::BoolParsing, input))
 }
 
 #[inline]
@@ -38,7 +58,9 @@ pub fn int_as_bool<'a>(input: &'a impl Input<'a>, int: i64) -> ValResult<'a, boo
 
 #[inline]
 pub fn str_as_int<'s, 'l>(input: &'s impl Input<'s>, str: &'l str) -> ValResult<'s, i64> {
-    if let Ok(i) = str.parse::<i64>() {
+    if let Some(i) = parse_int_fast(str.as_bytes()) {
+        Ok(i)
+    } else if let Ok(i) = str.parse::<i64>() {
         Ok(i)
     } else if let Ok(f) = str.parse::<f64>() {
         float_as_int(input, f)
@@ -47,6 +69,52 @@ pub fn str_as_int<'s, 'l>(input: &'s impl Input<'s>, str: &'l str) -> ValResult<
     }
 }
 
+/// Fast path for integers of up to 16 digits with an optional sign, the digits are checked and combined eight
+/// at a time as lanes of a `u64` (SWAR). Returns `None` for anything else, which is left to `str::parse`.
+fn parse_int_fast(bytes: &[u8]) -> Option<i64> {
+    let (negative, digits) = match bytes.first() {
+        Some(b'-') => (true, &bytes[1..]),
+        Some(b'+') => (false, &bytes[1..]),
+        _ => (false, bytes),
+    };
+    let value = match digits.len() {
+        1..=8 => parse_digits_chunk(digits)?,
+        9..=16 => {
+            let (high, low) = digits.split_at(digits.len() - 8);
+            parse_digits_chunk(high)? * 100_000_000 + parse_digits_chunk(low)?
+        }
+        _ => return None,
+    };
+    match negative {
+        true => Some(-(value as i64)),
+        false => Some(value as i64),
+    }
+}
+
+/// Parse up to eight ASCII digits, padded on the left with `'0'`s which don't change the value
+fn parse_digits_chunk(digits: &[u8]) -> Option<u64> {
+    let mut chunk = [b'0'; 8];
+    chunk[8 - digits.len()..].copy_from_slice(digits);
+    let pairs = digit_pairs(chunk)?;
+    // continue combining neighbouring lanes: 4 x 2 digits -> 2 x 4 -> 1 x 8
+    let quads = (pairs * 100 + (pairs >> 16)) & 0x0000_FFFF_0000_FFFF;
+    Some((quads * 10_000 + (quads >> 32)) & 0xFFFF_FFFF)
+}
+
+/// Check that all eight bytes are ASCII digits and combine neighbouring digits as lanes of a `u64` (SWAR),
+/// each 16 bit lane of the result holds a two digit number, the first two bytes in the lowest lane.
+/// Returns `None` if any byte isn't a digit.
+pub fn digit_pairs(bytes: [u8; 8]) -> Option<u64> {
+    let raw = u64::from_le_bytes(bytes);
+    // every byte must be in `b'0'..=b'9'`: the high nibble must be 3 both before and after adding 6
+    let high_nibbles = 0xF0F0_F0F0_F0F0_F0F0;
+    if (raw & high_nibbles) | ((raw.wrapping_add(0x0606_0606_0606_0606) & high_nibbles) >> 4) != 0x3333_3333_3333_3333 {
+        return None;
+    }
+    let digits = raw - 0x3030_3030_3030_3030;
+    Some((digits * 10 + (digits >> 8)) & 0x00FF_00FF_00FF_00FF)
+}
+
 pub fn float_as_int<'a>(input: &'a impl Input<'a>, float: f64) -> ValResult<'a, i64> {
     if float == f64::INFINITY {
         Err(ValError::new(ErrorKind::IntNan { nan_value: "infinity" }, input))
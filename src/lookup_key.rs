@@ -46,7 +46,8 @@ impl LookupKey {
     pub fn from_py(py: Python, value: &PyAny, alt_alias: Option<&str>) -> PyResult<Self> {
         if let Ok(alias_py) = value.cast_as::<PyString>() {
             let alias: String = alias_py.extract()?;
-            let alias_py: Py<PyString> = alias_py.into_py(py);
+            // interned so dict lookups against keys from source literals can short-circuit on pointer equality
+            let alias_py: Py<PyString> = py_string!(py, &alias);
             match alt_alias {
                 Some(alt_alias) => Ok(LookupKey::Choice(
                     alias,
@@ -1,6 +1,8 @@
+use std::sync::Arc;
+
 use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyDict, PyList, PySet};
 
 use ahash::AHashSet;
 
@@ -48,16 +50,20 @@ impl BuildValidator for LiteralBuilder {
 #[derive(Debug, Clone)]
 pub struct LiteralSingleStringValidator {
     expected: String,
-    repr: String,
+    repr: Arc<str>,
     name: String,
 }
 
 impl LiteralSingleStringValidator {
     fn new(expected: String) -> Self {
-        let repr = format!("'{}'", expected);
+        let repr: Arc<str> = format!("'{}'", expected).into();
         let name = format!("literal[{}]", repr);
         Self { expected, repr, name }
     }
+
+    pub fn expected(&self) -> &str {
+        &self.expected
+    }
 }
 
 impl Validator for LiteralSingleStringValidator {
@@ -90,15 +96,15 @@ impl Validator for LiteralSingleStringValidator {
 #[derive(Debug, Clone)]
 pub struct LiteralSingleIntValidator {
     expected: i64,
+    repr: Arc<str>,
     name: String,
 }
 
 impl LiteralSingleIntValidator {
     fn new(expected: i64) -> Self {
-        Self {
-            expected,
-            name: format!("literal[{}]", expected),
-        }
+        let repr: Arc<str> = expected.to_string().into();
+        let name = format!("literal[{}]", repr);
+        Self { expected, repr, name }
     }
 }
 
@@ -117,7 +123,7 @@ impl Validator for LiteralSingleIntValidator {
         } else {
             Err(ValError::new(
                 ErrorKind::LiteralSingleError {
-                    expected: self.expected.to_string(),
+                    expected: self.repr.clone(),
                 },
                 input,
             ))
@@ -132,7 +138,7 @@ impl Validator for LiteralSingleIntValidator {
 #[derive(Debug, Clone)]
 pub struct LiteralMultipleStringsValidator {
     expected: AHashSet<String>,
-    repr: String,
+    repr: Arc<str>,
     name: String,
 }
 
@@ -148,10 +154,14 @@ impl LiteralMultipleStringsValidator {
                 return None;
             }
         }
-        let repr = repr_args.join(", ");
+        let repr: Arc<str> = repr_args.join(", ").into();
         let name = format!("literal[{}]", repr);
         Some(Self { expected, repr, name })
     }
+
+    pub fn expected(&self) -> impl Iterator<Item = &str> {
+        self.expected.iter().map(|s| s.as_str())
+    }
 }
 
 impl Validator for LiteralMultipleStringsValidator {
@@ -184,7 +194,7 @@ impl Validator for LiteralMultipleStringsValidator {
 #[derive(Debug, Clone)]
 pub struct LiteralMultipleIntsValidator {
     expected: AHashSet<i64>,
-    repr: String,
+    repr: Arc<str>,
     name: String,
 }
 
@@ -200,7 +210,7 @@ impl LiteralMultipleIntsValidator {
                 return None;
             }
         }
-        let repr = repr_args.join(", ");
+        let repr: Arc<str> = repr_args.join(", ").into();
         let name = format!("literal[{}]", repr);
         Some(Self { expected, repr, name })
     }
@@ -238,7 +248,9 @@ pub struct LiteralGeneralValidator {
     expected_int: AHashSet<i64>,
     expected_str: AHashSet<String>,
     expected_py: Py<PyList>,
-    repr: String,
+    // the same values as `expected_py` if they're all hashable, so lookups don't need to scan the list
+    expected_py_set: Option<Py<PySet>>,
+    repr: Arc<str>,
     name: String,
 }
 
@@ -259,12 +271,19 @@ impl LiteralGeneralValidator {
                 expected_py.append(item)?;
             }
         }
-        let repr = repr_args.join(", ");
+        let expected_py_set = match expected_py.is_empty() {
+            true => None,
+            false => PySet::new(py, &expected_py.iter().collect::<Vec<_>>())
+                .ok()
+                .map(|set| set.into_py(py)),
+        };
+        let repr: Arc<str> = repr_args.join(", ").into();
         let name = format!("literal[{}]", repr);
         Ok(Self {
             expected_int,
             expected_str,
             expected_py: expected_py.into_py(py),
+            expected_py_set,
             repr,
             name,
         })
@@ -297,9 +316,17 @@ impl Validator for LiteralGeneralValidator {
 
         let py_value = input.to_object(py);
 
-        let expected_py = self.expected_py.as_ref(py);
-        if !expected_py.is_empty() && expected_py.contains(&py_value)? {
-            return Ok(py_value);
+        // an unhashable input can't be looked up in the set, but might still compare equal to an expected value
+        // (e.g. a `set` and a `frozenset`), so those are checked against the list as before
+        if let (Some(expected_py_set), Ok(_)) = (&self.expected_py_set, py_value.as_ref(py).hash()) {
+            if expected_py_set.as_ref(py).contains(&py_value)? {
+                return Ok(py_value);
+            }
+        } else {
+            let expected_py = self.expected_py.as_ref(py);
+            if !expected_py.is_empty() && expected_py.contains(&py_value)? {
+                return Ok(py_value);
+            }
         }
 
         Err(ValError::new(
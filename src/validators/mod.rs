@@ -1,12 +1,15 @@
-use std::fmt::Debug;
+use std::fmt::{Debug, Write};
+use std::sync::{Arc, Mutex};
 
+use ahash::AHashMap;
 use enum_dispatch::enum_dispatch;
+use indexmap::IndexMap;
 
 use pyo3::exceptions::PyTypeError;
-use pyo3::intern;
 use pyo3::once_cell::GILOnceCell;
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyByteArray, PyBytes, PyDict, PyString};
+use pyo3::types::{PyAny, PyBool, PyByteArray, PyBytes, PyDict, PyFloat, PyInt, PyList, PyString, PyTuple};
+use pyo3::{intern, PyTypeInfo};
 
 use crate::build_tools::{py_error, SchemaDict, SchemaError};
 use crate::errors::{ErrorKind, ValError, ValLineError, ValResult, ValidationError};
@@ -42,8 +45,9 @@ mod union;
 #[pyclass(module = "pydantic_core._pydantic_core")]
 #[derive(Debug, Clone)]
 pub struct SchemaValidator {
-    validator: CombinedValidator,
-    slots: Vec<CombinedValidator>,
+    // validators are immutable once built, so they're shared between clones and cached instances
+    validator: Arc<CombinedValidator>,
+    slots: Arc<Vec<CombinedValidator>>,
     schema: PyObject,
     title: PyObject,
 }
@@ -52,6 +56,15 @@ pub struct SchemaValidator {
 impl SchemaValidator {
     #[new]
     pub fn py_new(py: Python, schema: &PyAny, config: Option<&PyDict>) -> PyResult<Self> {
+        let cache_key = schema_cache_key(schema, config)?;
+        if let Some(ref key) = cache_key {
+            if let Some(mut cached) = get_cached_validator(py, key) {
+                // the cached validator doesn't hold a schema, use this caller's for `__reduce__`
+                cached.schema = schema.into_py(py);
+                return Ok(cached);
+            }
+        }
+
         let self_schema = Self::get_self_schema(py);
 
         let schema_obj = self_schema
@@ -71,12 +84,16 @@ impl SchemaValidator {
         validator.complete(&build_context)?;
         let slots = build_context.into_slots()?;
         let title = validator.get_name().into_py(py);
-        Ok(Self {
-            validator,
-            slots,
+        let schema_validator = Self {
+            validator: Arc::new(validator),
+            slots: Arc::new(slots),
             schema: schema.into_py(py),
             title,
-        })
+        };
+        if let Some(key) = cache_key {
+            cache_validator(py, key, &schema_validator);
+        }
+        Ok(schema_validator)
     }
 
     pub fn __reduce__(&self, py: Python) -> PyResult<PyObject> {
@@ -173,10 +190,10 @@ impl SchemaValidator {
         }
     }
 
-    pub fn validate_assignment(&self, py: Python, field: String, input: &PyAny, data: &PyDict) -> PyResult<PyObject> {
+    pub fn validate_assignment(&self, py: Python, field: &str, input: &PyAny, data: &PyDict) -> PyResult<PyObject> {
         let extra = Extra {
             data: Some(data),
-            field: Some(field.as_str()),
+            field: Some(field),
             strict: None,
             context: None,
         };
@@ -214,8 +231,8 @@ impl SchemaValidator {
             Err(err) => return Err(SchemaError::new_err(format!("Error building self-schema:\n  {}", err))),
         };
         Ok(Self {
-            validator,
-            slots: build_context.into_slots()?,
+            validator: Arc::new(validator),
+            slots: Arc::new(build_context.into_slots()?),
             schema: py.None(),
             title: "Self Schema".into_py(py),
         })
@@ -226,6 +243,132 @@ impl SchemaValidator {
     }
 }
 
+/// Maximum number of validators held in `SCHEMA_CACHE`, the oldest entry is evicted once this is reached
+const SCHEMA_CACHE_SIZE: usize = 1024;
+/// Maximum depth of schema we'll try to build a cache key for, this also protects against cyclic schemas
+const SCHEMA_CACHE_MAX_DEPTH: u16 = 64;
+/// Maximum length of a key in `SCHEMA_CACHE`, larger schemas aren't cached so the memory held by the cache
+/// stays bounded
+const SCHEMA_CACHE_MAX_KEY_LEN: usize = 4096;
+
+/// Validators built from schemas which consist solely of python literals, keyed by `schema_cache_key`,
+/// so constructing a `SchemaValidator` from the same schema again skips validating and building the schema.
+static SCHEMA_CACHE: GILOnceCell<Mutex<IndexMap<String, SchemaValidator>>> = GILOnceCell::new();
+
+fn get_cached_validator(py: Python, key: &str) -> Option<SchemaValidator> {
+    match SCHEMA_CACHE.get(py)?.lock() {
+        Ok(cache) => cache.get(key).cloned(),
+        Err(_) => None,
+    }
+}
+
+fn cache_validator(py: Python, key: String, schema_validator: &SchemaValidator) {
+    let cache = SCHEMA_CACHE.get_or_init(py, || Mutex::new(IndexMap::new()));
+    if let Ok(mut cache) = cache.lock() {
+        if cache.len() >= SCHEMA_CACHE_SIZE {
+            cache.shift_remove_index(0);
+        }
+        // the schema isn't kept so the cache doesn't hold on to, or later pickle, an object owned by the caller
+        let cached = SchemaValidator {
+            schema: py.None(),
+            ..schema_validator.clone()
+        };
+        cache.insert(key, cached);
+    }
+}
+
+/// Build a key uniquely identifying `schema` and `config`, or `None` if either contains anything other than
+/// dicts with string keys, lists, tuples, strings, ints, floats, bools and `None` - e.g. functions or classes,
+/// or if the key would be longer than `SCHEMA_CACHE_MAX_KEY_LEN`, in which case the validator isn't cached.
+fn schema_cache_key(schema: &PyAny, config: Option<&PyDict>) -> PyResult<Option<String>> {
+    let mut key = String::with_capacity(128);
+    if !write_cache_key(&mut key, schema, 0, SCHEMA_CACHE_MAX_KEY_LEN)? {
+        return Ok(None);
+    }
+    if let Some(config) = config {
+        key.push('|');
+        if !write_cache_key(&mut key, config, 0, SCHEMA_CACHE_MAX_KEY_LEN)? {
+            return Ok(None);
+        }
+    }
+    Ok(Some(key))
+}
+
+/// Write a key for `value` to `key`, returns `false` if `value` can't be represented or if `key` grows
+/// beyond `max_len`.
+///
+/// Validators built from schemas with the same key are shared (by `SCHEMA_CACHE` and the build memo), so a
+/// field `default` is only allowed if it's immutable, otherwise mutating the default of one validator would
+/// mutate the default of another built from a separate but equal schema.
+fn write_cache_key(key: &mut String, value: &PyAny, depth: u16, max_len: usize) -> PyResult<bool> {
+    if depth > SCHEMA_CACHE_MAX_DEPTH || key.len() > max_len {
+        return Ok(false);
+    }
+    // exact type checks so subclasses (e.g. enums) which might extract differently are never cached
+    if PyString::is_exact_type_of(value) {
+        // strings which aren't valid UTF-8 (e.g. lone surrogates) can't be part of a key, but are valid in a schema
+        let str = match value.cast_as::<PyString>()?.to_str() {
+            Ok(str) => str,
+            Err(_) => return Ok(false),
+        };
+        write!(key, "s{}:{}", str.len(), str).unwrap();
+    } else if PyBool::is_exact_type_of(value) {
+        key.push(if value.is_true()? { 'T' } else { 'F' });
+    } else if PyInt::is_exact_type_of(value) {
+        write!(key, "i{};", value.str()?.to_str()?).unwrap();
+    } else if PyFloat::is_exact_type_of(value) {
+        write!(key, "f{};", value.str()?.to_str()?).unwrap();
+    } else if value.is_none() {
+        key.push('N');
+    } else if PyDict::is_exact_type_of(value) {
+        key.push('{');
+        for (k, v) in value.cast_as::<PyDict>()?.iter() {
+            if !PyString::is_exact_type_of(k)
+                || (is_default_key(k) && !is_immutable_scalar(v))
+                || !write_cache_key(key, k, depth, max_len)?
+                || !write_cache_key(key, v, depth + 1, max_len)?
+            {
+                return Ok(false);
+            }
+        }
+        key.push('}');
+    } else if PyList::is_exact_type_of(value) {
+        key.push('[');
+        for item in value.cast_as::<PyList>()?.iter() {
+            if !write_cache_key(key, item, depth + 1, max_len)? {
+                return Ok(false);
+            }
+        }
+        key.push(']');
+    } else if PyTuple::is_exact_type_of(value) {
+        key.push('(');
+        for item in value.cast_as::<PyTuple>()?.iter() {
+            if !write_cache_key(key, item, depth + 1, max_len)? {
+                return Ok(false);
+            }
+        }
+        key.push(')');
+    } else {
+        return Ok(false);
+    }
+    Ok(key.len() <= max_len)
+}
+
+fn is_default_key(key: &PyAny) -> bool {
+    match key.cast_as::<PyString>().map(|k| k.to_str()) {
+        Ok(Ok(k)) => k == "default",
+        _ => false,
+    }
+}
+
+fn is_immutable_scalar(value: &PyAny) -> bool {
+    value.is_none()
+        || PyString::is_exact_type_of(value)
+        || PyBool::is_exact_type_of(value)
+        || PyInt::is_exact_type_of(value)
+        || PyFloat::is_exact_type_of(value)
+}
+
 fn parse_json(input: &PyAny) -> PyResult<serde_json::Result<JsonInput>> {
     if let Ok(py_bytes) = input.cast_as::<PyBytes>() {
         Ok(serde_json::from_slice(py_bytes.as_bytes()))
@@ -249,6 +392,9 @@ pub trait BuildValidator: Sized {
         -> PyResult<CombinedValidator>;
 }
 
+// not inlined so `build_validator`, which recurses once per level of schema nesting, doesn't take on the stack
+// frame of the largest `T::build` across all arms of `validator_match!`, only that of the validator being built
+#[inline(never)]
 fn build_single_validator<'a, T: BuildValidator>(
     val_type: &str,
     schema_dict: &'a PyDict,
@@ -295,12 +441,20 @@ pub fn build_validator<'a>(
         Ok(s) => s,
         Err(_) => {
             let dict = PyDict::new(py);
-            dict.set_item("type", schema)?;
+            dict.set_item(intern!(py, "type"), schema)?;
             dict
         }
     };
     let type_: &str = dict.get_as_req(intern!(py, "type"))?;
-    validator_match!(
+
+    let memo_key = build_context.memo_key(schema, config)?;
+    if let Some(ref key) = memo_key {
+        if let Some(validator) = build_context.memo.get(key) {
+            return Ok((validator.clone(), dict));
+        }
+    }
+    let slot_count = build_context.slots.len();
+    let (validator, dict) = validator_match!(
         type_,
         dict,
         config,
@@ -355,7 +509,12 @@ pub fn build_validator<'a>(
         // introspection types
         is_instance::IsInstanceValidator,
         callable::CallableValidator,
-    )
+    )?;
+    // validators which define slots can't be reused as the slot would then be shared
+    if let (Some(key), true) = (memo_key, build_context.slots.len() == slot_count) {
+        build_context.memo.insert(key, validator.clone());
+    }
+    Ok((validator, dict))
 }
 
 /// More (mostly immutable) data to pass between validators, should probably be class `Context`,
@@ -462,6 +621,18 @@ pub enum CombinedValidator {
     Callable(callable::CallableValidator),
 }
 
+impl CombinedValidator {
+    /// `true` if validation always returns the input unchanged, so callers can skip calling `validate`
+    #[inline]
+    pub fn is_noop(&self) -> bool {
+        match self {
+            Self::Any(_) => true,
+            Self::Nullable(validator) => validator.is_noop(),
+            _ => false,
+        }
+    }
+}
+
 /// This trait must be implemented by all validators, it allows various validators to be accessed consistently,
 /// validators defined in `build_validator` also need `EXPECTED_TYPE` as a const, but that can't be part of the trait
 #[enum_dispatch(CombinedValidator)]
@@ -493,9 +664,32 @@ pub trait Validator: Send + Sync + Clone + Debug {
 #[derive(Default, Clone)]
 pub struct BuildContext {
     slots: Vec<(String, Option<CombinedValidator>)>,
+    /// validators already built from small sub-schemas, so repeated sub-schemas (e.g. the same field type
+    /// used on many fields) are cloned rather than built again
+    memo: AHashMap<String, CombinedValidator>,
 }
 
+/// Maximum length of the key for sub-schemas to be memoized in `BuildContext`, this restricts memoization
+/// to small schemas which are cheap to compare and to clone
+const BUILD_MEMO_MAX_KEY_LEN: usize = 256;
+
 impl BuildContext {
+    /// Key identifying `schema` and `config` within a single build, `None` if the schema shouldn't be memoized
+    fn memo_key(&self, schema: &PyAny, config: Option<&PyDict>) -> PyResult<Option<String>> {
+        let mut key = String::with_capacity(64);
+        if !write_cache_key(&mut key, schema, 0, BUILD_MEMO_MAX_KEY_LEN)? {
+            return Ok(None);
+        }
+        // config is included by value as model configs can be merged into it in place during the build
+        if let Some(config) = config {
+            key.push('|');
+            if !write_cache_key(&mut key, config, 0, BUILD_MEMO_MAX_KEY_LEN * 2)? {
+                return Ok(None);
+            }
+        }
+        Ok(Some(key))
+    }
+
     /// First of two part process to add a new validator slot, we add the `slot_ref` to the array, but not the
     /// actual `validator`, we can't add the validator until it's build.
     /// We need the `id` to build the validator, hence this two-step process.
@@ -539,7 +733,9 @@ impl BuildContext {
 
     /// Move validators into a new vec which maintains the order of slots, `complete` is called on each validator
     /// at the same time.
-    pub fn into_slots(self) -> PyResult<Vec<CombinedValidator>> {
+    pub fn into_slots(mut self) -> PyResult<Vec<CombinedValidator>> {
+        // the memo is only needed while building, drop it so it isn't needlessly cloned below
+        self.memo = AHashMap::new();
         let self_clone = self.clone();
         self.slots
             .into_iter()
@@ -78,8 +78,8 @@ impl Validator for ModelClassValidator {
         if input.is_type(class)? {
             if self.revalidate {
                 let fields_set = input.get_attr(intern!(py, "__fields_set__"));
-                let output = self.validator.validate(py, input, extra, slots, recursion_guard)?;
-                let (model_dict, validation_fields_set): (&PyAny, &PyAny) = output.extract(py)?;
+                let (model_dict, validation_fields_set) =
+                    self.validate_fields(py, input, extra, slots, recursion_guard)?;
                 let fields_set = fields_set.unwrap_or(validation_fields_set);
                 Ok(self.create_class(py, model_dict, fields_set)?)
             } else {
@@ -93,8 +93,7 @@ impl Validator for ModelClassValidator {
                 input,
             ))
         } else {
-            let output = self.validator.validate(py, input, extra, slots, recursion_guard)?;
-            let (model_dict, fields_set): (&PyAny, &PyAny) = output.extract(py)?;
+            let (model_dict, fields_set) = self.validate_fields(py, input, extra, slots, recursion_guard)?;
             Ok(self.create_class(py, model_dict, fields_set)?)
         }
     }
@@ -105,6 +104,33 @@ impl Validator for ModelClassValidator {
 }
 
 impl ModelClassValidator {
+    pub fn typed_dict(&self) -> &TypedDictValidator {
+        &self.validator
+    }
+
+    fn validate_fields<'s, 'data>(
+        &'s self,
+        py: Python<'data>,
+        input: &'data impl Input<'data>,
+        extra: &Extra,
+        slots: &'data [CombinedValidator],
+        recursion_guard: &'s mut RecursionGuard,
+    ) -> ValResult<'data, (&'data PyAny, &'data PyAny)> {
+        if extra.field.is_some() {
+            // validating assignment, the typed dict returns a tuple of the updated dict and fields set
+            let output = self.validator.validate(py, input, extra, slots, recursion_guard)?;
+            return Ok(output.into_ref(py).extract()?);
+        }
+        match self
+            .validator
+            .validate_fields(py, input, extra, slots, recursion_guard)?
+        {
+            (model_dict, Some(fields_set)) => Ok((model_dict.as_ref(), fields_set.as_ref())),
+            // return_fields_set is required when building the model-class validator
+            (_, None) => unreachable!(),
+        }
+    }
+
     fn create_class(&self, py: Python, model_dict: &PyAny, fields_set: &PyAny) -> PyResult<PyObject> {
         // based on the following but with the second argument of new_func set to an empty tuple as required
         // https://github.com/PyO3/pyo3/blob/d2caa056e9aacc46374139ef491d112cb8af1a25/src/pyclass_init.rs#L35-L77
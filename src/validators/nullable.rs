@@ -24,13 +24,26 @@ impl BuildValidator for NullableValidator {
         build_context: &mut BuildContext,
     ) -> PyResult<CombinedValidator> {
         let schema: &PyAny = schema.get_as_req(intern!(schema.py(), "schema"))?;
-        let validator = Box::new(build_validator(schema, config, build_context)?.0);
+        let validator = match build_validator(schema, config, build_context)?.0 {
+            // `nullable[nullable[T]]` behaves exactly like `nullable[T]`, so avoid the second dispatch and
+            // `None` check by using the inner validator directly
+            nullable @ CombinedValidator::Nullable(_) => return Ok(nullable),
+            validator => Box::new(validator),
+        };
         let name = format!("{}[{}]", Self::EXPECTED_TYPE, validator.get_name());
         Ok(Self { validator, name }.into())
     }
 }
 
+impl NullableValidator {
+    /// `None` is returned unchanged, so this is a noop if the inner validator is
+    pub fn is_noop(&self) -> bool {
+        self.validator.is_noop()
+    }
+}
+
 impl Validator for NullableValidator {
+    #[inline]
     fn validate<'s, 'data>(
         &'s self,
         py: Python<'data>,
@@ -1,11 +1,16 @@
+use std::sync::{Arc, Mutex};
+
 use pyo3::intern;
+use pyo3::once_cell::GILOnceCell;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyString};
+
+use indexmap::IndexMap;
 use regex::Regex;
 
 use crate::build_tools::{is_strict, py_error, schema_or_config};
 use crate::errors::{ErrorKind, ValError, ValResult};
-use crate::input::Input;
+use crate::input::{EitherString, Input};
 use crate::recursion_guard::RecursionGuard;
 
 use super::{BuildContext, BuildValidator, CombinedValidator, Extra, Validator};
@@ -72,7 +77,7 @@ impl Validator for StrValidator {
 #[derive(Debug, Clone)]
 pub struct StrConstrainedValidator {
     strict: bool,
-    pattern: Option<Regex>,
+    pattern: Option<Pattern>,
     max_length: Option<usize>,
     min_length: Option<usize>,
     strip_whitespace: bool,
@@ -90,6 +95,28 @@ impl Validator for StrConstrainedValidator {
         _recursion_guard: &'s mut RecursionGuard,
     ) -> ValResult<'data, PyObject> {
         let either_str = input.validate_str(extra.strict.unwrap_or(self.strict))?;
+        self.validate_either_str(py, input, either_str, true)
+    }
+
+    fn get_name(&self) -> &str {
+        "constrained-str"
+    }
+}
+
+impl StrConstrainedValidator {
+    pub fn pattern(&self) -> Option<&Regex> {
+        self.pattern.as_ref().map(|pattern| &pattern.regex)
+    }
+
+    /// Apply length constraints and transformations to a string, `check_pattern` can be false if the caller
+    /// has already confirmed the string matches `pattern`.
+    pub fn validate_either_str<'data>(
+        &self,
+        py: Python<'data>,
+        input: &'data impl Input<'data>,
+        either_str: EitherString<'data>,
+        check_pattern: bool,
+    ) -> ValResult<'data, PyObject> {
         let cow = either_str.as_cow();
         let mut str = cow.as_ref();
         if let Some(min_length) = self.min_length {
@@ -103,25 +130,38 @@ impl Validator for StrConstrainedValidator {
                 return Err(ValError::new(ErrorKind::StrTooLong { max_length }, input));
             }
         }
-        if let Some(pattern) = &self.pattern {
-            if !pattern.is_match(str) {
+        if let (true, Some(pattern)) = (check_pattern, &self.pattern) {
+            if !pattern.regex.is_match(str) {
                 return Err(ValError::new(
                     ErrorKind::StrPatternMismatch {
-                        pattern: pattern.to_string(),
+                        pattern: pattern.source.clone(),
                     },
                     input,
                 ));
             }
         }
 
+        // the vast majority of strings are ASCII, in which case we can work on bytes rather than decoding chars,
+        // only checked if the string is going to be modified
+        let is_ascii = (self.strip_whitespace || self.to_lower || self.to_upper) && str.is_ascii();
+
         if self.strip_whitespace {
-            str = str.trim();
+            str = match is_ascii {
+                true => trim_ascii(str),
+                false => str.trim(),
+            };
         }
 
         let py_string = if self.to_lower {
-            PyString::new(py, &str.to_lowercase())
+            match is_ascii {
+                true => PyString::new(py, &str.to_ascii_lowercase()),
+                false => PyString::new(py, &str.to_lowercase()),
+            }
         } else if self.to_upper {
-            PyString::new(py, &str.to_uppercase())
+            match is_ascii {
+                true => PyString::new(py, &str.to_ascii_uppercase()),
+                false => PyString::new(py, &str.to_uppercase()),
+            }
         } else if self.strip_whitespace {
             PyString::new(py, str)
         } else {
@@ -131,18 +171,15 @@ impl Validator for StrConstrainedValidator {
         Ok(py_string.into_py(py))
     }
 
-    fn get_name(&self) -> &str {
-        "constrained-str"
-    }
-}
-
-impl StrConstrainedValidator {
     fn build(schema: &PyDict, config: Option<&PyDict>) -> PyResult<CombinedValidator> {
         let py = schema.py();
         let pattern_str: Option<&str> =
             schema_or_config(schema, config, intern!(py, "pattern"), intern!(py, "str_pattern"))?;
         let pattern = match pattern_str {
-            Some(s) => Some(build_regex(s)?),
+            Some(s) => Some(Pattern {
+                regex: build_regex(py, s)?,
+                source: s.into(),
+            }),
             None => None,
         };
         let min_length: Option<usize> =
@@ -175,9 +212,51 @@ impl StrConstrainedValidator {
     }
 }
 
-fn build_regex(pattern: &str) -> PyResult<Regex> {
-    match Regex::new(pattern) {
-        Ok(r) => Ok(r),
-        Err(e) => py_error!("{}", e),
+#[derive(Debug, Clone)]
+struct Pattern {
+    regex: Regex,
+    // shared with `StrPatternMismatch` errors so the pattern isn't copied on every failure
+    source: Arc<str>,
+}
+
+/// Maximum number of compiled patterns held in `REGEX_CACHE`, the oldest entry is evicted once this is reached
+const REGEX_CACHE_SIZE: usize = 1024;
+
+/// Compiled regexes keyed by pattern, so the same pattern used in many schemas is only compiled once,
+/// cloning a `Regex` is cheap as the compiled program is shared.
+static REGEX_CACHE: GILOnceCell<Mutex<IndexMap<String, Regex>>> = GILOnceCell::new();
+
+fn build_regex(py: Python, pattern: &str) -> PyResult<Regex> {
+    let cache = REGEX_CACHE.get_or_init(py, || Mutex::new(IndexMap::new()));
+    if let Ok(cache) = cache.lock() {
+        if let Some(regex) = cache.get(pattern) {
+            return Ok(regex.clone());
+        }
     }
+    let regex = match Regex::new(pattern) {
+        Ok(r) => r,
+        Err(e) => return py_error!("{}", e),
+    };
+    if let Ok(mut cache) = cache.lock() {
+        if cache.len() >= REGEX_CACHE_SIZE {
+            cache.shift_remove_index(0);
+        }
+        cache.insert(pattern.to_string(), regex.clone());
+    }
+    Ok(regex)
+}
+
+/// Equivalent to `str::trim` for ASCII strings, `char::is_whitespace` matches `\t`, `\n`, `\x0b`, `\x0c`, `\r`
+/// and space in the ASCII range.
+fn trim_ascii(str: &str) -> &str {
+    let is_ws = |b: &u8| matches!(b, b'\t'..=b'\r' | b' ');
+    let bytes = str.as_bytes();
+    let start = match bytes.iter().position(|b| !is_ws(b)) {
+        Some(start) => start,
+        None => return "",
+    };
+    // a non-whitespace byte exists, so rposition can't fail
+    let end = bytes.iter().rposition(|b| !is_ws(b)).unwrap_or(start);
+    // slicing on ASCII byte offsets is always on a char boundary
+    &str[start..=end]
 }
@@ -1,8 +1,10 @@
+use std::sync::atomic::{AtomicUsize, Ordering};
+
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyFunction, PyList, PySet, PyString};
 use pyo3::{intern, PyTypeInfo};
 
-use ahash::AHashSet;
+use ahash::{AHashMap, AHashSet};
 
 use crate::build_tools::{is_strict, py_error, schema_or_config, SchemaDict};
 use crate::errors::{py_err_string, ErrorKind, ValError, ValLineError, ValResult};
@@ -24,9 +26,35 @@ struct TypedDictField {
     validator: CombinedValidator,
 }
 
+const FIELD_INDEX_MIN_FIELDS: usize = 4;
+
+/// Index of the field most recently found by `get_field`, since repeated assignments are usually to the same
+/// field, checking it first means a single string comparison in the common case
+#[derive(Debug, Default)]
+struct LastField(AtomicUsize);
+
+impl LastField {
+    fn get(&self) -> usize {
+        self.0.load(Ordering::Relaxed)
+    }
+
+    fn set(&self, index: usize) {
+        self.0.store(index, Ordering::Relaxed)
+    }
+}
+
+impl Clone for LastField {
+    fn clone(&self) -> Self {
+        Self(AtomicUsize::new(self.get()))
+    }
+}
+
 #[derive(Debug, Clone)]
 pub struct TypedDictValidator {
     fields: Vec<TypedDictField>,
+    // only populated for wider typed dicts, below this a linear scan is quicker than hashing the name
+    field_index: AHashMap<String, usize>,
+    last_assigned_field: LastField,
     check_extra: bool,
     forbid_extra: bool,
     extra_validator: Option<Box<CombinedValidator>>,
@@ -140,8 +168,15 @@ impl BuildValidator for TypedDictValidator {
                 default_factory,
             });
         }
+
+        let field_index = match fields.len() > FIELD_INDEX_MIN_FIELDS {
+            true => fields.iter().enumerate().map(|(i, f)| (f.name.clone(), i)).collect(),
+            false => AHashMap::new(),
+        };
         Ok(Self {
             fields,
+            field_index,
+            last_assigned_field: LastField::default(),
             check_extra,
             forbid_extra,
             extra_validator,
@@ -166,13 +201,49 @@ impl Validator for TypedDictValidator {
             // we're validating assignment, completely different logic
             return self.validate_assignment(py, field, input, extra, slots, recursion_guard);
         }
+        match self.validate_fields(py, input, extra, slots, recursion_guard)? {
+            (output_dict, Some(fields_set)) => Ok((output_dict, fields_set).to_object(py)),
+            (output_dict, None) => Ok(output_dict.to_object(py)),
+        }
+    }
+
+    fn get_name(&self) -> &str {
+        Self::EXPECTED_TYPE
+    }
+
+    fn complete(&mut self, build_context: &BuildContext) -> PyResult<()> {
+        self.fields
+            .iter_mut()
+            .try_for_each(|f| f.validator.complete(build_context))
+    }
+}
+
+impl TypedDictValidator {
+    /// Name, lookup key and validator of each field, used to find a discriminator for unions of typed dicts
+    pub fn iter_fields(&self) -> impl Iterator<Item = (&str, &LookupKey, &CombinedValidator)> {
+        self.fields
+            .iter()
+            .map(|f| (f.name.as_str(), &f.lookup_key, &f.validator))
+    }
+
+    /// Validate `input` returning the output dict and, if `return_fields_set` is set, the fields set, without
+    /// first packing them into a tuple as `validate` does.
+    pub fn validate_fields<'s, 'data>(
+        &'s self,
+        py: Python<'data>,
+        input: &'data impl Input<'data>,
+        extra: &Extra,
+        slots: &'data [CombinedValidator],
+        recursion_guard: &'s mut RecursionGuard,
+    ) -> ValResult<'data, (&'data PyDict, Option<&'data PySet>)> {
         let strict = extra.strict.unwrap_or(self.strict);
         let dict = input.validate_typed_dict(strict, self.from_attributes)?;
 
         let output_dict = PyDict::new(py);
-        let mut errors: Vec<ValLineError> = Vec::with_capacity(self.fields.len());
-        let mut fields_set_vec: Option<Vec<Py<PyString>>> = match self.return_fields_set {
-            true => Some(Vec::with_capacity(self.fields.len())),
+        // errors are the exception, so don't reserve space for them up front
+        let mut errors: Vec<ValLineError> = Vec::new();
+        let mut fields_set: Option<FieldsSet> = match self.return_fields_set {
+            true => Some(FieldsSet::default()),
             false => None,
         };
 
@@ -191,8 +262,8 @@ impl Validator for TypedDictValidator {
         };
 
         macro_rules! process {
-            ($dict:ident, $get_method:ident, $iter:block) => {{
-                for field in &self.fields {
+            ($dict:ident, $get_method:ident, $iter:block, $input_len:expr) => {{
+                for (index, field) in self.fields.iter().enumerate() {
                     let op_key_value = match field.lookup_key.$get_method($dict) {
                         Ok(v) => v,
                         Err(err) => {
@@ -212,14 +283,21 @@ impl Validator for TypedDictValidator {
                             // extra logic either way
                             used_keys.insert(used_key);
                         }
+                        if field.validator.is_noop() {
+                            output_dict.set_item(&field.name_pystring, value.to_object(py))?;
+                            if let Some(ref mut fs) = fields_set {
+                                fs.add_field(index);
+                            }
+                            continue;
+                        }
                         match field
                             .validator
                             .validate(py, value, &extra, slots, recursion_guard)
                         {
                             Ok(value) => {
                                 output_dict.set_item(&field.name_pystring, value)?;
-                                if let Some(ref mut fs) = fields_set_vec {
-                                    fs.push(field.name_pystring.clone_ref(py));
+                                if let Some(ref mut fs) = fields_set {
+                                    fs.add_field(index);
                                 }
                             }
                             Err(ValError::LineErrors(line_errors)) => {
@@ -244,7 +322,15 @@ impl Validator for TypedDictValidator {
                     }
                 }
 
-                if self.check_extra {
+                // used keys are all keys of the input, so if there are as many of them as input keys
+                // there can't be any extra keys and we can skip iterating over the input again
+                let input_len: Option<usize> = $input_len;
+                let may_have_extra = match (&used_keys, input_len) {
+                    (Some(used_keys), Some(input_len)) => used_keys.len() < input_len,
+                    _ => true,
+                };
+
+                if self.check_extra && may_have_extra {
                     let used_keys = match used_keys {
                         Some(v) => v,
                         None => unreachable!(),
@@ -277,17 +363,14 @@ impl Validator for TypedDictValidator {
                         }
 
                         let py_key = either_str.as_py_string(py);
-                        if let Some(ref mut fs) = fields_set_vec {
-                            fs.push(py_key.into_py(py));
+                        if let Some(ref mut fs) = fields_set {
+                            fs.add_extra(py_key.into_py(py));
                         }
 
                         if let Some(ref validator) = self.extra_validator {
                             match validator.validate(py, value, &extra, slots, recursion_guard) {
                                 Ok(value) => {
                                     output_dict.set_item(py_key, value)?;
-                                    if let Some(ref mut fs) = fields_set_vec {
-                                        fs.push(py_key.into_py(py));
-                                    }
                                 }
                                 Err(ValError::LineErrors(line_errors)) => {
                                     for err in line_errors {
@@ -298,42 +381,40 @@ impl Validator for TypedDictValidator {
                             }
                         } else {
                             output_dict.set_item(py_key, value.to_object(py))?;
-                            if let Some(ref mut fs) = fields_set_vec {
-                                fs.push(py_key.into_py(py));
-                            }
                         }
                     }
                 }
             }};
         }
         match dict {
-            GenericMapping::PyDict(d) => process!(d, py_get_item, { d.iter() }),
-            GenericMapping::PyGetAttr(d) => process!(d, py_get_attr, { IterAttributes::new(d) }),
-            GenericMapping::JsonObject(d) => process!(d, json_get, { d.iter() }),
+            GenericMapping::PyDict(d) => process!(d, py_get_item, { d.iter() }, Some(d.len())),
+            GenericMapping::PyGetAttr(d) => process!(d, py_get_attr, { IterAttributes::new(d) }, None),
+            GenericMapping::JsonObject(d) => process!(d, json_get, { d.iter() }, Some(d.len())),
         }
 
         if !errors.is_empty() {
             Err(ValError::LineErrors(errors))
-        } else if let Some(fs) = fields_set_vec {
-            let fields_set = PySet::new(py, &fs)?;
-            Ok((output_dict, fields_set).to_object(py))
+        } else if let Some(fs) = fields_set {
+            Ok((output_dict, Some(fs.into_py_set(py, &self.fields)?)))
         } else {
-            Ok(output_dict.to_object(py))
+            Ok((output_dict, None))
         }
     }
 
-    fn get_name(&self) -> &str {
-        Self::EXPECTED_TYPE
-    }
-
-    fn complete(&mut self, build_context: &BuildContext) -> PyResult<()> {
-        self.fields
-            .iter_mut()
-            .try_for_each(|f| f.validator.complete(build_context))
+    fn get_field(&self, name: &str) -> Option<&TypedDictField> {
+        if let Some(field) = self.fields.get(self.last_assigned_field.get()) {
+            if field.name == name {
+                return Some(field);
+            }
+        }
+        let index = match self.field_index.is_empty() {
+            true => self.fields.iter().position(|f| f.name == name),
+            false => self.field_index.get(name).copied(),
+        }?;
+        self.last_assigned_field.set(index);
+        Some(&self.fields[index])
     }
-}
 
-impl TypedDictValidator {
     fn validate_assignment<'s, 'data>(
         &'s self,
         py: Python<'data>,
@@ -374,7 +455,7 @@ impl TypedDictValidator {
             Err(err) => Err(err),
         };
 
-        if let Some(field) = self.fields.iter().find(|f| f.name == field) {
+        if let Some(field) = self.get_field(field) {
             prepare_result(field.validator.validate(py, input, extra, slots, recursion_guard))
         } else if self.check_extra && !self.forbid_extra {
             // this is the "allow" case of extra_behavior
@@ -395,6 +476,45 @@ impl TypedDictValidator {
     }
 }
 
+/// Records which fields were set during validation, fields are recorded by index in a bitmap (overflowing
+/// into a vec beyond 64 fields) and only converted to a python set once validation has succeeded
+#[derive(Default)]
+struct FieldsSet {
+    mask: u64,
+    overflow: Vec<usize>,
+    extra: Vec<Py<PyString>>,
+}
+
+impl FieldsSet {
+    fn add_field(&mut self, index: usize) {
+        match index < u64::BITS as usize {
+            true => self.mask |= 1 << index,
+            false => self.overflow.push(index),
+        }
+    }
+
+    fn add_extra(&mut self, key: Py<PyString>) {
+        self.extra.push(key);
+    }
+
+    fn into_py_set<'py>(self, py: Python<'py>, fields: &[TypedDictField]) -> PyResult<&'py PySet> {
+        let mut names: Vec<&PyString> = Vec::with_capacity(self.mask.count_ones() as usize + self.extra.len());
+        let mut mask = self.mask;
+        while mask != 0 {
+            names.push(fields[mask.trailing_zeros() as usize].name_pystring.as_ref(py));
+            // clear the lowest set bit
+            mask &= mask - 1;
+        }
+        names.extend(
+            self.overflow
+                .into_iter()
+                .map(|index| fields[index].name_pystring.as_ref(py)),
+        );
+        names.extend(self.extra.iter().map(|key| key.as_ref(py)));
+        PySet::new(py, &names)
+    }
+}
+
 pub struct IterAttributes<'a> {
     object: &'a PyAny,
     attributes: &'a PyList,
@@ -6,6 +6,7 @@ use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList, PyString};
 
 use ahash::AHashMap;
+use regex::RegexSet;
 
 use crate::build_tools::{is_strict, schema_or_config, SchemaDict};
 use crate::errors::{ErrorKind, ValError, ValLineError, ValResult};
@@ -18,6 +19,11 @@ use super::{build_validator, BuildContext, BuildValidator, CombinedValidator, Ex
 #[derive(Debug, Clone)]
 pub struct UnionValidator {
     choices: Vec<CombinedValidator>,
+    // when every choice is a string with a pattern, all patterns are matched in a single pass
+    pattern_set: Option<RegexSet>,
+    // when every choice is a typed dict with a literal string field in common, the value of that field
+    // identifies the only choice which can succeed
+    discriminator: Option<UnionDiscriminator>,
     strict: bool,
     name: String,
 }
@@ -37,9 +43,13 @@ impl BuildValidator for UnionValidator {
             .collect::<PyResult<Vec<CombinedValidator>>>()?;
 
         let descr = choices.iter().map(|v| v.get_name()).collect::<Vec<_>>().join(",");
+        let pattern_set = build_pattern_set(&choices);
+        let discriminator = UnionDiscriminator::build(&choices);
 
         Ok(Self {
             choices,
+            pattern_set,
+            discriminator,
             strict: is_strict(schema, config)?,
             name: format!("{}[{}]", Self::EXPECTED_TYPE, descr),
         }
@@ -56,14 +66,47 @@ impl Validator for UnionValidator {
         slots: &'data [CombinedValidator],
         recursion_guard: &'s mut RecursionGuard,
     ) -> ValResult<'data, PyObject> {
+        if let Some(ref pattern_set) = self.pattern_set {
+            if let Some(output) = self.validate_pattern_set(py, input, pattern_set)? {
+                return Ok(output);
+            }
+        }
+        // errors from the choice picked by the discriminator, so that choice isn't validated again below
+        let mut discriminated: Option<(usize, Vec<ValLineError>)> = None;
+        if let (Some(discriminator), None) = (&self.discriminator, extra.field) {
+            if let Some(index) = discriminator.find_choice(input) {
+                // try the same passes as below, but only on the matching choice
+                let validator = &self.choices[index];
+                let mut line_errors = match validator.validate(py, input, &extra.as_strict(), slots, recursion_guard) {
+                    Err(ValError::LineErrors(line_errors)) => line_errors,
+                    otherwise => return otherwise,
+                };
+                if !extra.strict.unwrap_or(self.strict) {
+                    line_errors = match validator.validate(py, input, extra, slots, recursion_guard) {
+                        Err(ValError::LineErrors(line_errors)) => line_errors,
+                        otherwise => return otherwise,
+                    };
+                }
+                // validation failed, fall through so errors include all choices as usual
+                discriminated = Some((index, line_errors));
+            }
+        }
+        let skip = discriminated.as_ref().map(|(index, _)| *index);
+
         if extra.strict.unwrap_or(self.strict) {
             let mut errors: Vec<ValLineError> = Vec::with_capacity(self.choices.len());
             let strict_strict = extra.as_strict();
 
-            for validator in &self.choices {
-                let line_errors = match validator.validate(py, input, &strict_strict, slots, recursion_guard) {
-                    Err(ValError::LineErrors(line_errors)) => line_errors,
-                    otherwise => return otherwise,
+            for (index, validator) in self.choices.iter().enumerate() {
+                let line_errors = match Some(index) == skip {
+                    true => discriminated
+                        .take()
+                        .map(|(_, line_errors)| line_errors)
+                        .unwrap_or_default(),
+                    false => match validator.validate(py, input, &strict_strict, slots, recursion_guard) {
+                        Err(ValError::LineErrors(line_errors)) => line_errors,
+                        otherwise => return otherwise,
+                    },
                 };
 
                 errors.extend(
@@ -81,7 +124,9 @@ impl Validator for UnionValidator {
             if let Some(res) = self
                 .choices
                 .iter()
-                .map(|validator| validator.validate(py, input, &strict_strict, slots, recursion_guard))
+                .enumerate()
+                .filter(|(index, _)| Some(*index) != skip)
+                .map(|(_, validator)| validator.validate(py, input, &strict_strict, slots, recursion_guard))
                 .find(ValResult::is_ok)
             {
                 return res;
@@ -90,10 +135,16 @@ impl Validator for UnionValidator {
             let mut errors: Vec<ValLineError> = Vec::with_capacity(self.choices.len());
 
             // 2nd pass: check if the value can be coerced into one of the Union types, e.g. use validate
-            for validator in &self.choices {
-                let line_errors = match validator.validate(py, input, extra, slots, recursion_guard) {
-                    Err(ValError::LineErrors(line_errors)) => line_errors,
-                    success => return success,
+            for (index, validator) in self.choices.iter().enumerate() {
+                let line_errors = match Some(index) == skip {
+                    true => discriminated
+                        .take()
+                        .map(|(_, line_errors)| line_errors)
+                        .unwrap_or_default(),
+                    false => match validator.validate(py, input, extra, slots, recursion_guard) {
+                        Err(ValError::LineErrors(line_errors)) => line_errors,
+                        success => return success,
+                    },
                 };
 
                 errors.extend(
@@ -116,6 +167,116 @@ impl Validator for UnionValidator {
     }
 }
 
+impl UnionValidator {
+    /// Try only the choices whose pattern matches the input, returns `None` if no choice succeeds so the
+    /// normal path can build the full set of errors.
+    fn validate_pattern_set<'data>(
+        &self,
+        py: Python<'data>,
+        input: &'data impl Input<'data>,
+        pattern_set: &RegexSet,
+    ) -> ValResult<'data, Option<PyObject>> {
+        // strings are valid in both strict and lax mode, anything else goes through the normal path
+        let matches = match input.strict_str() {
+            Ok(either_str) => pattern_set.matches(either_str.as_cow().as_ref()),
+            Err(_) => return Ok(None),
+        };
+        for index in matches.iter() {
+            if let CombinedValidator::StrConstrained(ref validator) = self.choices[index] {
+                match validator.validate_either_str(py, input, input.strict_str()?, false) {
+                    Ok(output) => return Ok(Some(output)),
+                    Err(ValError::LineErrors(_)) => continue,
+                    Err(err) => return Err(err),
+                }
+            }
+        }
+        Ok(None)
+    }
+}
+
+fn build_pattern_set(choices: &[CombinedValidator]) -> Option<RegexSet> {
+    if choices.len() < 2 {
+        return None;
+    }
+    let patterns = choices
+        .iter()
+        .map(|choice| match choice {
+            CombinedValidator::StrConstrained(validator) => validator.pattern().map(|p| p.as_str()),
+            _ => None,
+        })
+        .collect::<Option<Vec<&str>>>()?;
+    RegexSet::new(patterns).ok()
+}
+
+/// A literal string field common to all choices of a union of typed dicts (or model classes), where each tag
+/// belongs to exactly one choice, so the tag in the input identifies the only choice which can succeed.
+#[derive(Debug, Clone)]
+struct UnionDiscriminator {
+    lookup_key: LookupKey,
+    tags: AHashMap<String, usize>,
+}
+
+impl UnionDiscriminator {
+    fn build(choices: &[CombinedValidator]) -> Option<Self> {
+        if choices.len() < 2 {
+            return None;
+        }
+        let typed_dicts = choices
+            .iter()
+            .map(|choice| match choice {
+                CombinedValidator::TypedDict(validator) => Some(validator),
+                CombinedValidator::ModelClass(validator) => Some(validator.typed_dict()),
+                _ => None,
+            })
+            .collect::<Option<Vec<_>>>()?;
+
+        'fields: for (name, lookup_key, _) in typed_dicts[0].iter_fields() {
+            let key_repr = lookup_key.to_string();
+            let mut tags: AHashMap<String, usize> = AHashMap::new();
+            for (index, typed_dict) in typed_dicts.iter().enumerate() {
+                let expected = match typed_dict.iter_fields().find(|(n, _, _)| *n == name) {
+                    Some((_, key, validator)) if key.to_string() == key_repr => literal_strings(validator),
+                    _ => None,
+                };
+                let expected = match expected {
+                    Some(expected) => expected,
+                    None => continue 'fields,
+                };
+                for tag in expected {
+                    if tags.insert(tag.to_string(), index).is_some() {
+                        // tags must be unique to identify a single choice
+                        continue 'fields;
+                    }
+                }
+            }
+            return Some(Self {
+                lookup_key: lookup_key.clone(),
+                tags,
+            });
+        }
+        None
+    }
+
+    /// Index of the choice matching the tag in `input`, `None` if `input` isn't a dict or doesn't contain a
+    /// known tag
+    fn find_choice<'data>(&self, input: &'data impl Input<'data>) -> Option<usize> {
+        let tag = match input.strict_dict() {
+            Ok(GenericMapping::PyDict(dict)) => self.lookup_key.py_get_item(dict).ok()??.1.strict_str(),
+            Ok(GenericMapping::JsonObject(dict)) => self.lookup_key.json_get(dict).ok()??.1.strict_str(),
+            _ => return None,
+        };
+        self.tags.get(tag.ok()?.as_cow().as_ref()).copied()
+    }
+}
+
+fn literal_strings(validator: &CombinedValidator) -> Option<Vec<&str>> {
+    match validator {
+        CombinedValidator::LiteralSingleString(validator) => Some(vec![validator.expected()]),
+        CombinedValidator::LiteralMultipleStrings(validator) => Some(validator.expected().collect()),
+        _ => None,
+    }
+}
+
 #[derive(Debug, Clone)]
 enum Discriminator {
     /// use `LookupKey` to find the tag, same as we do to find values in typed_dict aliases
@@ -2,7 +2,7 @@ import pickle
 
 import pytest
 
-from pydantic_core import SchemaError, SchemaValidator
+from pydantic_core import SchemaError, SchemaValidator, ValidationError
 
 
 def test_build_error_type():
@@ -49,6 +49,34 @@ def test_pickle(pickle_protocol: int) -> None:
     assert repr(v1) == repr(v2)
 
 
+def test_schema_reused():
+    schema = {'type': 'str', 'max_length': 5}
+    v1 = SchemaValidator(schema)
+    assert SchemaValidator(schema).validate_python('12345') == '12345'
+
+    schema['max_length'] = 10
+    v2 = SchemaValidator(schema)
+    assert v2.validate_python('1234567') == '1234567'
+    with pytest.raises(ValidationError, match='String must have at most 5 characters'):
+        v1.validate_python('1234567')
+
+    v3 = SchemaValidator(schema, {'str_to_upper': True})
+    assert v3.validate_python('abc') == 'ABC'
+    assert v2.validate_python('abc') == 'abc'
+
+
+def test_pickle_cached_schema():
+    schema = {'type': 'str', 'max_length': 6}
+    SchemaValidator(schema)
+    schema['max_length'] = 10
+
+    # built from the cache, but pickled using its own schema, not the one mutated above
+    v = SchemaValidator({'type': 'str', 'max_length': 6})
+    v2 = pickle.loads(pickle.dumps(v))
+    with pytest.raises(ValidationError, match='String must have at most 6 characters'):
+        v2.validate_python('1234567')
+
+
 def test_schema_recursive_error():
     schema = {'type': 'union', 'choices': []}
     schema['choices'].append({'type': 'nullable', 'schema': schema})
@@ -65,6 +93,65 @@ def test_not_schema_recursive_error():
     assert repr(v).count('TypedDictField') == 101
 
 
+def test_repeated_sub_schema_config():
+    class MyModel:
+        __slots__ = '__dict__', '__fields_set__'
+
+    v = SchemaValidator(
+        {
+            'type': 'typed-dict',
+            'fields': {
+                'a': {'schema': 'str'},
+                'b': {
+                    'schema': {
+                        'type': 'model-class',
+                        'class_type': MyModel,
+                        'config': {'str_max_length': 3},
+                        'schema': {'type': 'typed-dict', 'return_fields_set': True, 'fields': {'c': {'schema': 'str'}}},
+                    }
+                },
+                'd': {'schema': 'str'},
+            },
+        }
+    )
+    output = v.validate_python({'a': 'long string', 'b': {'c': 'abc'}, 'd': 'long string'})
+    assert output['a'] == output['d'] == 'long string'
+    assert output['b'].c == 'abc'
+    with pytest.raises(ValidationError, match='String must have at most 3 characters'):
+        v.validate_python({'a': 'x', 'b': {'c': 'long string'}, 'd': 'x'})
+
+
+def test_surrogate_in_schema():
+    # lone surrogates can't be encoded as UTF-8, so can't be part of a cache key, but the schema is still valid
+    v = SchemaValidator({'type': 'literal', 'expected': ['\ud800']})
+    assert 'literal' in repr(v)
+
+
+def test_mutable_default_not_shared():
+    v1 = SchemaValidator({'type': 'typed-dict', 'fields': {'a': {'schema': 'list', 'default': []}}})
+    v2 = SchemaValidator({'type': 'typed-dict', 'fields': {'a': {'schema': 'list', 'default': []}}})
+    v1.validate_python({})['a'].append(1)
+    assert v2.validate_python({}) == {'a': []}
+
+
+def test_large_schema():
+    fields = {f'field_{i}': {'schema': {'type': 'str', 'max_length': i + 1}} for i in range(500)}
+    v = SchemaValidator({'type': 'typed-dict', 'full': False, 'fields': fields})
+    assert v.validate_python({'field_499': 'x'}) == {'field_499': 'x'}
+
+
+def test_deeply_nested_schema():
+    schema = 'int'
+    for _ in range(100):
+        schema = {'type': 'list', 'items_schema': schema}
+    v = SchemaValidator(schema)
+
+    value = 1
+    for _ in range(100):
+        value = [value]
+    assert v.validate_python(value) == value
+
+
 def test_no_type():
     with pytest.raises(SchemaError, match='Unable to extract tag using discriminator self-schema'):
         SchemaValidator({})
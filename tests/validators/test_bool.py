@@ -20,6 +20,17 @@ from ..conftest import Err, PyAndJson, plain_repr
         ('no', False),
         ('true', True),
         ('false', False),
+        ('tRuE', True),
+        ('FALSE', False),
+        ('Off', False),
+        ('ON', True),
+        ('Y', True),
+        ('f', False),
+        ('0', False),
+        ('1', True),
+        ('no\x00', Err('Value must be a valid boolean, unable to interpret input [kind=bool_parsing')),
+        ('', Err('Value must be a valid boolean, unable to interpret input [kind=bool_parsing')),
+        ('falsey', Err('Value must be a valid boolean, unable to interpret input [kind=bool_parsing')),
         (
             'cheese',
             Err(
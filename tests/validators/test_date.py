@@ -107,6 +107,32 @@ def test_date_strict(input_value, expected):
         assert output == expected
 
 
+@pytest.mark.parametrize(
+    'input_value,expected',
+    [
+        ('0001-01-01', date(1, 1, 1)),
+        ('9999-12-31', date(9999, 12, 31)),
+        ('2000-02-29', date(2000, 2, 29)),
+        ('2024-02-29', date(2024, 2, 29)),
+        ('1900-02-29', Err('[kind=date_parsing')),
+        ('2022-02-30', Err('[kind=date_parsing')),
+        ('2022-04-31', Err('[kind=date_parsing')),
+        ('2022-13-01', Err('[kind=date_parsing')),
+        ('2022-00-01', Err('[kind=date_parsing')),
+        ('2022-01-00', Err('[kind=date_parsing')),
+        ('2022-0a-01', Err('[kind=date_parsing')),
+        ('2022/01/01', Err('[kind=date_parsing')),
+    ],
+)
+def test_date_parsing(input_value, expected):
+    v = SchemaValidator({'type': 'date'})
+    if isinstance(expected, Err):
+        with pytest.raises(ValidationError, match=re.escape(expected.message)):
+            v.validate_python(input_value)
+    else:
+        assert v.validate_python(input_value) == expected
+
+
 @pytest.mark.parametrize(
     'input_value,expected',
     [
@@ -198,3 +224,10 @@ def test_union():
     v = SchemaValidator({'type': 'union', 'choices': ['date', 'str']})
     assert v.validate_python('2022-01-02') == '2022-01-02'
     assert v.validate_python(date(2022, 1, 2)) == date(2022, 1, 2)
+
+
+def test_date_surrogate():
+    # strings which can't be encoded as UTF-8 are rejected as the wrong type, rather than parsed lossily
+    v = SchemaValidator({'type': 'date'})
+    with pytest.raises(ValidationError, match=r'kind=date_type'):
+        v.validate_python('2022-06-08\ud800')
@@ -259,3 +259,10 @@ def test_union():
 def test_invalid_constraint():
     with pytest.raises(SchemaError, match='datetime -> gt\n  Value must be a valid datetime'):
         SchemaValidator({'type': 'datetime', 'gt': 'foobar'})
+
+
+def test_datetime_surrogate():
+    # strings which can't be encoded as UTF-8 are rejected as the wrong type, rather than parsed lossily
+    v = SchemaValidator({'type': 'datetime'})
+    with pytest.raises(ValidationError, match=r'kind=datetime_type'):
+        v.validate_python('2022-06-08\ud800')
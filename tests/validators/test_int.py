@@ -46,6 +46,35 @@ def test_int_py_and_json(py_and_json: PyAndJson, input_value, expected):
         assert isinstance(output, int)
 
 
+@pytest.mark.parametrize(
+    'input_value,expected',
+    [
+        ('-0', 0),
+        ('+7', 7),
+        ('-42', -42),
+        ('00012', 12),
+        ('12345678', 12_345_678),
+        ('123456789', 123_456_789),
+        ('-9999999999999999', -9_999_999_999_999_999),
+        ('12345678901234567', 12_345_678_901_234_567),
+        ('1.0', 1),
+        pytest.param('', Err('unable to parse string as an integer [kind=int_parsing'), id='empty'),
+        pytest.param('-', Err('unable to parse string as an integer [kind=int_parsing'), id='sign'),
+        pytest.param('1234567:', Err('unable to parse string as an integer [kind=int_parsing'), id='colon'),
+        pytest.param('12 34', Err('unable to parse string as an integer [kind=int_parsing'), id='space'),
+    ],
+)
+def test_int_parsing(py_and_json: PyAndJson, input_value, expected):
+    v = py_and_json({'type': 'int'})
+    if isinstance(expected, Err):
+        with pytest.raises(ValidationError, match=re.escape(expected.message)):
+            v.validate_test(input_value)
+    else:
+        output = v.validate_test(input_value)
+        assert output == expected
+        assert isinstance(output, int)
+
+
 @pytest.mark.parametrize(
     'input_value,expected',
     [
@@ -61,6 +61,15 @@ def test_literal_py_and_json(py_and_json: PyAndJson, kwarg_expected, input_value
         ([1, b'whatever'], b'whatever', b'whatever'),
         ([(1, 2), (3, 4)], (1, 2), (1, 2)),
         ([(1, 2), (3, 4)], (3, 4), (3, 4)),
+        pytest.param(
+            [(1, 2), (3, 4)],
+            [1, 2],
+            Err('Value must be one of: (1, 2), (3, 4) [kind=literal_error, input_value=[1, 2], input_type=list]'),
+            id='unhashable-input',
+        ),
+        ([1, [1, 2], (3, 4)], [1, 2], [1, 2]),
+        ([frozenset({1, 2}), (3, 4)], {1, 2}, {1, 2}),
+        ([1, [1, 2], (3, 4)], (3, 4), (3, 4)),
         pytest.param(
             [1, b'whatever'],
             3,
@@ -78,6 +87,20 @@ def test_literal_not_json(kwarg_expected, input_value, expected):
         assert v.validate_python(input_value) == expected
 
 
+def test_literal_eq_error():
+    class BadEq:
+        def __hash__(self):
+            return hash(1.5)
+
+        def __eq__(self, other):
+            raise TypeError('bad eq')
+
+    v = SchemaValidator({'type': 'literal', 'expected': [BadEq(), (3, 4)]})
+    assert v.validate_python((3, 4)) == (3, 4)
+    with pytest.raises(TypeError, match='bad eq'):
+        v.validate_python(1.5)
+
+
 def test_build_error():
     with pytest.raises(SchemaError, match='SchemaError: "expected" must have length > 0'):
         SchemaValidator({'type': 'literal', 'expected': []})
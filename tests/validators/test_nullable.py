@@ -2,6 +2,8 @@ import pytest
 
 from pydantic_core import SchemaValidator, ValidationError
 
+from ..conftest import plain_repr
+
 
 def test_nullable():
     v = SchemaValidator({'type': 'nullable', 'schema': {'type': 'int'}})
@@ -33,3 +35,12 @@ def test_union_nullable_bool_int():
     assert v.validate_python(None) is None
     assert v.validate_python(True) is True
     assert v.validate_python(1) == 1
+
+
+def test_nested_nullable():
+    v = SchemaValidator({'type': 'nullable', 'schema': {'type': 'nullable', 'schema': {'type': 'int'}}})
+    assert 'name:"nullable[int]"' in plain_repr(v)
+    assert v.validate_python(None) is None
+    assert v.validate_python('123') == 123
+    with pytest.raises(ValidationError, match='Value must be a valid integer'):
+        v.validate_python('hello')
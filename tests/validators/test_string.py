@@ -65,6 +65,11 @@ def test_str_not_json(input_value, expected):
         ({'to_lower': True}, 'fooBar', 'foobar'),
         ({'strip_whitespace': True}, ' foobar  ', 'foobar'),
         ({'strip_whitespace': True, 'to_upper': True}, ' fooBar', 'FOOBAR'),
+        ({'strip_whitespace': True}, '\t\x0b\x0c\r\n foobar \n', 'foobar'),
+        ({'strip_whitespace': True}, ' \t ', ''),
+        ({'strip_whitespace': True}, '\u2003fo\u00f6bar\u3000 ', 'fo\u00f6bar'),
+        ({'to_upper': True}, 'fo\u00f6Bar', 'FO\u00d6BAR'),
+        ({'to_lower': True}, 'FO\u00d6bar', 'fo\u00f6bar'),
         ({'min_length': 5}, '12345', '12345'),
         ({'min_length': 5}, '1234', Err('String must have at least 5 characters [kind=too_short')),
         ({'max_length': 5}, '12345', '12345'),
@@ -122,6 +127,16 @@ def test_invalid_regex():
     )
 
 
+def test_shared_regex():
+    # the same pattern compiled for different schemas, the second build uses the cached regex
+    v1 = SchemaValidator({'type': 'str', 'pattern': r'^\d+$'})
+    v2 = SchemaValidator({'type': 'str', 'pattern': r'^\d+$', 'to_upper': True})
+    assert v1.validate_python('123') == '123'
+    assert v2.validate_python('123') == '123'
+    with pytest.raises(ValidationError, match='String must match pattern'):
+        v2.validate_python('abc')
+
+
 def test_regex_error():
     v = SchemaValidator({'type': 'str', 'pattern': '11'})
     with pytest.raises(ValidationError) as exc_info:
@@ -190,3 +190,10 @@ def test_union():
     v = SchemaValidator({'type': 'union', 'choices': ['time', 'str']})
     assert v.validate_python('12:01:02') == '12:01:02'
     assert v.validate_python(time(12, 1, 2)) == time(12, 1, 2)
+
+
+def test_time_surrogate():
+    # strings which can't be encoded as UTF-8 are rejected as the wrong type, rather than parsed lossily
+    v = SchemaValidator({'type': 'time'})
+    with pytest.raises(ValidationError, match=r'kind=time_type'):
+        v.validate_python('12:13:14\ud800')
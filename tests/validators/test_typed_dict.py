@@ -147,6 +147,42 @@ def test_ignore_extra():
     )
 
 
+def test_any_fields(py_and_json: PyAndJson):
+    v = py_and_json(
+        {
+            'type': 'typed-dict',
+            'return_fields_set': True,
+            'fields': {
+                'field_a': {'schema': 'any'},
+                'field_b': {'schema': {'type': 'nullable', 'schema': 'any'}},
+                'field_c': {'schema': 'any', 'default': 42},
+            },
+        }
+    )
+    assert v.validate_test({'field_a': [1, 'x'], 'field_b': None}) == (
+        {'field_a': [1, 'x'], 'field_b': None, 'field_c': 42},
+        {'field_a', 'field_b'},
+    )
+    assert v.validate_test({'field_a': {'x': 1}, 'field_b': 'foo', 'field_c': 3}) == (
+        {'field_a': {'x': 1}, 'field_b': 'foo', 'field_c': 3},
+        {'field_a', 'field_b', 'field_c'},
+    )
+
+
+def test_fields_set_many_fields():
+    v = SchemaValidator(
+        {
+            'type': 'typed-dict',
+            'return_fields_set': True,
+            'extra_behavior': 'allow',
+            'fields': {f'f_{i}': {'schema': 'int', 'required': False} for i in range(70)},
+        }
+    )
+    input_value = {f'f_{i}': i for i in range(0, 70, 3)}
+    input_value['extra'] = 'x'
+    assert v.validate_python(input_value) == (input_value, set(input_value))
+
+
 def test_forbid_extra():
     v = SchemaValidator(
         {
@@ -161,6 +197,25 @@ def test_forbid_extra():
         v.validate_python({'field_a': 123, 'field_b': 1})
 
 
+def test_forbid_extra_alias(py_and_json: PyAndJson):
+    v = py_and_json(
+        {
+            'type': 'typed-dict',
+            'fields': {
+                'field_a': {'schema': 'int', 'alias': 'FieldA'},
+                'field_b': {'schema': 'int', 'required': False},
+            },
+            'extra_behavior': 'forbid',
+            'populate_by_name': True,
+        }
+    )
+    assert v.validate_test({'FieldA': 1, 'field_b': 2}) == {'field_a': 1, 'field_b': 2}
+    assert v.validate_test({'field_a': 1}) == {'field_a': 1}
+
+    with pytest.raises(ValidationError, match='field_a\n +Extra values are not permitted'):
+        v.validate_test({'FieldA': 1, 'field_a': 2})
+
+
 def test_allow_extra():
     v = SchemaValidator(
         {
@@ -278,6 +333,33 @@ def test_validate_assignment_functions():
     assert calls == ['func_a']
 
 
+def test_validate_assignment_many_fields():
+    v = SchemaValidator(
+        {
+            'type': 'typed-dict',
+            'return_fields_set': True,
+            'fields': {f'field_{i}': {'schema': {'type': 'int'}} for i in range(10)},
+        }
+    )
+    data = {f'field_{i}': i for i in range(10)}
+
+    assert v.validate_assignment('field_7', '42', data) == ({**data, 'field_7': 42}, {'field_7'})
+
+    with pytest.raises(ValidationError, match='Extra values are not permitted'):
+        v.validate_assignment('field_10', 1, data)
+
+
+def test_validate_assignment_repeated():
+    v = SchemaValidator({'type': 'typed-dict', 'fields': {'field_a': {'schema': 'str'}, 'field_b': {'schema': 'int'}}})
+    data = {'field_a': 'x', 'field_b': 1}
+    for _ in range(3):
+        assert v.validate_assignment('field_b', '2', data) == {'field_a': 'x', 'field_b': 2}
+        assert v.validate_assignment('field_b', '3', data) == {'field_a': 'x', 'field_b': 3}
+        assert v.validate_assignment('field_a', 4, data) == {'field_a': '4', 'field_b': 3}
+        with pytest.raises(ValidationError, match='Extra values are not permitted'):
+            v.validate_assignment('field_c', 1, data)
+
+
 def test_validate_assignment_ignore_extra():
     v = SchemaValidator(
         {'type': 'typed-dict', 'return_fields_set': True, 'fields': {'field_a': {'schema': {'type': 'str'}}}}
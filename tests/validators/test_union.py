@@ -2,6 +2,8 @@ import pytest
 
 from pydantic_core import SchemaError, SchemaValidator, ValidationError
 
+from ..conftest import PyAndJson
+
 
 @pytest.mark.parametrize(
     'input_value,expected_value',
@@ -244,3 +246,107 @@ def test_strict_union():
         {'kind': 'bool_type', 'loc': ['bool'], 'message': 'Value must be a valid boolean', 'input_value': '123'},
         {'kind': 'int_type', 'loc': ['int'], 'message': 'Value must be a valid integer', 'input_value': '123'},
     ]
+
+
+def test_union_str_patterns():
+    v = SchemaValidator(
+        {
+            'type': 'union',
+            'choices': [
+                {'type': 'str', 'pattern': r'^\d+$', 'max_length': 3},
+                {'type': 'str', 'pattern': r'^\d+$', 'to_upper': True},
+                {'type': 'str', 'pattern': r'^[a-z]+$', 'to_upper': True},
+            ],
+        }
+    )
+    assert v.validate_python('123') == '123'
+    assert v.validate_python('12345') == '12345'
+    assert v.validate_python('abc') == 'ABC'
+    assert v.validate_python(b'abc') == 'ABC'
+
+    with pytest.raises(ValidationError) as exc_info:
+        v.validate_python('ABC')
+
+    assert [e['kind'] for e in exc_info.value.errors()] == [
+        'str_pattern_mismatch',
+        'str_pattern_mismatch',
+        'str_pattern_mismatch',
+    ]
+
+
+def test_union_literal_discriminator(py_and_json: PyAndJson):
+    v = py_and_json(
+        {
+            'type': 'union',
+            'choices': [
+                {
+                    'type': 'typed-dict',
+                    'fields': {
+                        'kind': {'schema': {'type': 'literal', 'expected': ['cat']}},
+                        'meows': {'schema': 'int'},
+                    },
+                },
+                {
+                    'type': 'typed-dict',
+                    'fields': {
+                        'kind': {'schema': {'type': 'literal', 'expected': ['dog', 'puppy']}},
+                        'barks': {'schema': 'float'},
+                    },
+                },
+            ],
+        }
+    )
+    assert v.validate_test({'kind': 'cat', 'meows': '3'}) == {'kind': 'cat', 'meows': 3}
+    assert v.validate_test({'kind': 'puppy', 'barks': 1.5}) == {'kind': 'puppy', 'barks': 1.5}
+
+    with pytest.raises(ValidationError) as exc_info:
+        v.validate_test({'kind': 'dog', 'meows': 3})
+    assert [(e['kind'], e['loc']) for e in exc_info.value.errors()] == [
+        ('literal_error', ['typed-dict', 'kind']),
+        ('missing', ['typed-dict', 'barks']),
+    ]
+
+    with pytest.raises(ValidationError) as exc_info:
+        v.validate_test({'kind': 'fish'})
+    assert len(exc_info.value.errors()) == 4
+
+
+def test_union_discriminator_failure_not_revalidated():
+    calls = []
+
+    def check_meows(value, **kwargs):
+        calls.append(value)
+        raise ValueError('too few meows')
+
+    v = SchemaValidator(
+        {
+            'type': 'union',
+            'choices': [
+                {
+                    'type': 'typed-dict',
+                    'fields': {
+                        'kind': {'schema': {'type': 'literal', 'expected': ['cat']}},
+                        'meows': {
+                            'schema': {'type': 'function', 'mode': 'after', 'function': check_meows, 'schema': 'int'}
+                        },
+                    },
+                },
+                {
+                    'type': 'typed-dict',
+                    'fields': {
+                        'kind': {'schema': {'type': 'literal', 'expected': ['dog']}},
+                        'barks': {'schema': 'float'},
+                    },
+                },
+            ],
+        }
+    )
+    with pytest.raises(ValidationError) as exc_info:
+        v.validate_python({'kind': 'cat', 'meows': 1})
+    # once in strict mode and once in lax mode, as without the discriminator
+    assert calls == [1, 1]
+    assert [(e['kind'], e['loc']) for e in exc_info.value.errors()] == [
+        ('value_error', ['typed-dict', 'meows']),
+        ('literal_error', ['typed-dict', 'kind']),
+        ('missing', ['typed-dict', 'barks']),
+    ]